@@ -4,14 +4,97 @@ Vedic Astrology Prediction Generator
 Advanced system for generating personalized horoscope readings based on birth details
 """
 
-import ephem
-import pytz
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
+import bisect
+import copy
+import io
+import itertools
 import math
+import re
+import threading
 
-@dataclass
+if TYPE_CHECKING:
+    import ephem
+
+# ephem loads its ephemeris tables on import, so it is only imported
+# once a chart is actually calculated
+_ephem = None
+
+def _load_ephem():
+    """Import ephem on first use"""
+    global _ephem
+    if _ephem is None:
+        import ephem
+        _ephem = ephem
+    return _ephem
+
+# Completed readings shared by all VedicAstrology instances, least recently
+# used first, guarded by a lock so the cache can sit behind a web server
+READING_CACHE_SIZE = 1024
+_reading_cache = OrderedDict()
+_reading_cache_lock = threading.Lock()
+
+_J2000 = datetime(2000, 1, 1, 12)
+
+def _julian_date(dt: datetime) -> float:
+    """Julian date of a naive UTC datetime"""
+    return 2451545.0 + (dt - _J2000).total_seconds() / 86400.0
+
+def _gmst_deg(jd: float) -> float:
+    """Greenwich mean sidereal time in degrees (Meeus, Astronomical Algorithms 12.4)"""
+    d = jd - 2451545.0
+    t = d / 36525.0
+    return (280.46061837 + 360.98564736629 * d + t * t * 0.000387933 - t ** 3 / 38710000.0) % 360
+
+@lru_cache(maxsize=4096)
+def _ayanamsa_cached(year: int, month: int, day: int) -> float:
+    """Lahiri ayanamsa approximation for a calendar date"""
+    year = year + (month - 1) / 12.0 + (day - 1) / 365.25
+    return 23.85 + (year - 1900) * 0.013888889
+
+@lru_cache(maxsize=4096)
+def _lunar_nodes_cached(year: int, month: int, day: int) -> Tuple[float, float]:
+    """Mean Rahu and Ketu longitudes for a calendar date"""
+    days_since_epoch = (datetime(year, month, day) - datetime(1900, 1, 1)).days
+    mean_node = 125.044522 - 0.0529539222 * days_since_epoch
+    
+    rahu = mean_node % 360
+    ketu = (rahu + 180) % 360
+    return rahu, ketu
+
+# Vimshottari dasha sequence and mahadasha lengths in years
+_DASHA_SEQUENCE = ("Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury")
+_DASHA_YEARS = (7.0, 20.0, 6.0, 10.0, 7.0, 18.0, 16.0, 19.0, 17.0)
+_DASHA_CYCLE_YEARS = sum(_DASHA_YEARS)
+_DASHA_START_INDEX = {planet: i for i, planet in enumerate(_DASHA_SEQUENCE)}
+
+# Lords of the 27 nakshatras cycle through the dasha sequence three times
+_NAKSHATRA_LORDS = _DASHA_SEQUENCE * 3
+
+# Cumulative end year of each mahadasha for a cycle beginning at every start index
+_DASHA_CUMULATIVE = tuple(
+    tuple(itertools.accumulate(_DASHA_YEARS[start:] + _DASHA_YEARS[:start]))
+    for start in range(len(_DASHA_YEARS))
+)
+
+def _find_current_dasha(start_index: int, elapsed_years: float) -> Tuple[int, float]:
+    """Find the running mahadasha, return (planet index, remaining years)"""
+    # The sequence repeats every 120 years
+    elapsed_years %= _DASHA_CYCLE_YEARS
+    cumulative = _DASHA_CUMULATIVE[start_index]
+    i = bisect.bisect_right(cumulative, elapsed_years)
+    return (start_index + i) % len(_DASHA_YEARS), cumulative[i] - elapsed_years
+
+# (nakshatra index, pada) for each 1/3 degree cell of the zodiac:
+# a nakshatra spans 40 cells (13°20') and each pada 10 cells (3°20')
+_NAKSHATRA_CELLS = tuple((cell // 40, (cell % 40) // 10 + 1) for cell in range(1080))
+
+@dataclass(slots=True, frozen=True)
 class BirthDetails:
     """Store birth information"""
     name: str
@@ -46,10 +129,25 @@ class VedicAstrology:
         "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17
     }
     
+    # Bodies computed by ephem, in birth chart order (ephem class names)
+    PLANET_BODIES = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+    
     def __init__(self):
         self.birth_chart = {}
         self.current_dasha = {}
         self.predictions = {}
+        # Body objects are recomputed in place for every chart
+        ephem = _load_ephem()
+        self._bodies = [(name, getattr(ephem, name)()) for name in self.PLANET_BODIES]
+    
+    def _get_observer(self, birth_details: BirthDetails) -> "ephem.Observer":
+        """Return the ephem observer for a birth place and time"""
+        # Not cached: repeat births are already served by the reading cache
+        observer = _load_ephem().Observer()
+        observer.lat = str(birth_details.latitude)
+        observer.lon = str(birth_details.longitude)
+        observer.date = birth_details.birth_date
+        return observer
     
     def calculate_planetary_positions(self, birth_details: BirthDetails) -> Dict:
         """Calculate planetary positions for the birth chart"""
@@ -58,64 +156,43 @@ class VedicAstrology:
         birth_dt = birth_details.birth_date
         
         # Create observer location
-        observer = ephem.Observer()
-        observer.lat = str(birth_details.latitude)
-        observer.lon = str(birth_details.longitude) 
-        observer.date = birth_dt
-        
-        planets = {}
-        
-        # Calculate positions for all planets
-        sun = ephem.Sun(observer)
-        moon = ephem.Moon(observer)
-        mercury = ephem.Mercury(observer)
-        venus = ephem.Venus(observer)
-        mars = ephem.Mars(observer)
-        jupiter = ephem.Jupiter(observer)
-        saturn = ephem.Saturn(observer)
+        observer = self._get_observer(birth_details)
         
         # Convert to tropical longitude and then to sidereal (subtract ayanamsa)
         ayanamsa = self.calculate_ayanamsa(birth_dt)
         
-        # Use ecliptic longitude instead of RA
-        planets['Sun'] = self.get_sign_and_degree(float(sun.hlong) * 180/math.pi - ayanamsa)
-        planets['Moon'] = self.get_sign_and_degree(float(moon.hlong) * 180/math.pi - ayanamsa)
-        planets['Mercury'] = self.get_sign_and_degree(float(mercury.hlong) * 180/math.pi - ayanamsa)
-        planets['Venus'] = self.get_sign_and_degree(float(venus.hlong) * 180/math.pi - ayanamsa)
-        planets['Mars'] = self.get_sign_and_degree(float(mars.hlong) * 180/math.pi - ayanamsa)
-        planets['Jupiter'] = self.get_sign_and_degree(float(jupiter.hlong) * 180/math.pi - ayanamsa)
-        planets['Saturn'] = self.get_sign_and_degree(float(saturn.hlong) * 180/math.pi - ayanamsa)
+        # Calculate positions for all planets in one pass,
+        # using ecliptic longitude instead of RA
+        names = []
+        longitudes = []
+        for name, body in self._bodies:
+            body.compute(observer)
+            names.append(name)
+            longitudes.append(math.degrees(body.hlong) - ayanamsa)
         
         # Calculate Rahu and Ketu (lunar nodes)
         moon_node = self.calculate_lunar_nodes(birth_dt)
-        planets['Rahu'] = self.get_sign_and_degree(moon_node['rahu'])
-        planets['Ketu'] = self.get_sign_and_degree(moon_node['ketu'])
+        names += ['Rahu', 'Ketu']
+        longitudes += [moon_node['rahu'], moon_node['ketu']]
         
-        return planets
+        return dict(zip(names, self.get_signs_and_degrees(longitudes)))
     
     def calculate_ayanamsa(self, date: datetime) -> float:
         """Calculate ayanamsa (precession correction) for sidereal calculations"""
-        # Using Lahiri ayanamsa approximation
-        year = date.year + (date.month - 1) / 12.0 + (date.day - 1) / 365.25
-        ayanamsa = 23.85 + (year - 1900) * 0.013888889
-        return ayanamsa
+        # Using Lahiri ayanamsa approximation, which only depends on the date
+        return _ayanamsa_cached(date.year, date.month, date.day)
     
     def calculate_lunar_nodes(self, date: datetime) -> Dict:
         """Calculate Rahu and Ketu positions"""
         # Simplified calculation - in practice, use more precise ephemeris
-        days_since_epoch = (date - datetime(1900, 1, 1)).days
-        mean_node = 125.044522 - 0.0529539222 * days_since_epoch
-        
-        rahu = mean_node % 360
-        ketu = (rahu + 180) % 360
-        
+        rahu, ketu = _lunar_nodes_cached(date.year, date.month, date.day)
         return {'rahu': rahu, 'ketu': ketu}
     
     def get_sign_and_degree(self, longitude: float) -> Dict:
         """Convert longitude to sign and degree"""
-        longitude = longitude % 360
-        sign_num = int(longitude // 30)
-        degree = longitude % 30
+        sign_num, degree = divmod(longitude % 360, 30)
+        # Tiny negative longitudes round up to exactly 360 in the modulo
+        sign_num = int(sign_num) % 12
         
         return {
             'sign': self.SIGNS[sign_num],
@@ -123,23 +200,22 @@ class VedicAstrology:
             'sign_num': sign_num
         }
     
+    def get_signs_and_degrees(self, longitudes: List[float]) -> List[Dict]:
+        """Convert a batch of longitudes to signs and degrees"""
+        convert = self.get_sign_and_degree
+        return [convert(longitude) for longitude in longitudes]
+    
     def calculate_ascendant(self, birth_details: BirthDetails) -> Dict:
         """Calculate ascendant (rising sign)"""
         # Simplified calculation - real implementation would use sidereal time
-        observer = ephem.Observer()
-        observer.lat = str(birth_details.latitude)
-        observer.lon = str(birth_details.longitude)
-        observer.date = birth_details.birth_date
-        
-        # Calculate local sidereal time
-        lst = observer.sidereal_time()
-        lst_deg = float(lst) * 180 / math.pi
+        # Calculate local sidereal time from the mean sidereal time at Greenwich
+        jd = _julian_date(birth_details.birth_date)
+        lst_deg = (_gmst_deg(jd) + birth_details.longitude) % 360
         
         # Calculate ascendant longitude
+        lst_rad = math.radians(lst_deg)
         lat_rad = math.radians(birth_details.latitude)
-        asc_long = math.atan2(math.cos(lst_deg * math.pi/180), 
-                             -math.sin(lst_deg * math.pi/180) * math.cos(lat_rad))
-        asc_long = asc_long * 180 / math.pi
+        asc_long = math.degrees(math.atan2(math.cos(lst_rad), -math.sin(lst_rad) * math.cos(lat_rad)))
         
         # Apply ayanamsa correction
         ayanamsa = self.calculate_ayanamsa(birth_details.birth_date)
@@ -153,334 +229,416 @@ class VedicAstrology:
         moon_nakshatra = self.get_nakshatra(birth_moon.get('degree', 0) + birth_moon.get('sign_num', 0) * 30)
         
         # Dasha starting planet based on birth nakshatra
-        dasha_sequence = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
-        nakshatra_lords = [
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury",
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury",
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"
-        ]
-        
         birth_nakshatra_index = moon_nakshatra['index']
-        starting_dasha = nakshatra_lords[birth_nakshatra_index]
+        starting_dasha = _NAKSHATRA_LORDS[birth_nakshatra_index]
         
         # Calculate elapsed time since birth
         current_date = datetime.now()
         elapsed_years = (current_date - birth_details.birth_date).days / 365.25
         
         # Find current dasha
-        total_elapsed = 0
-        current_mahadasha = starting_dasha
-        
-        for i, planet in enumerate(dasha_sequence):
-            if planet == starting_dasha:
-                start_index = i
-                break
-        
-        for i in range(9):  # Maximum 120 years cycle
-            planet_index = (start_index + i) % 9
-            planet = dasha_sequence[planet_index]
-            period_years = self.DASHA_PERIODS[planet]
-            
-            if total_elapsed + period_years > elapsed_years:
-                current_mahadasha = planet
-                remaining_years = (total_elapsed + period_years) - elapsed_years
-                break
-            total_elapsed += period_years
+        start_index = _DASHA_START_INDEX[starting_dasha]
+        planet_index, remaining_years = _find_current_dasha(start_index, elapsed_years)
         
         return {
-            'mahadasha': current_mahadasha,
+            'mahadasha': _DASHA_SEQUENCE[planet_index],
             'remaining_years': remaining_years,
             'birth_nakshatra': moon_nakshatra['name']
         }
     
     def get_nakshatra(self, longitude: float) -> Dict:
         """Get nakshatra from longitude"""
-        nakshatra_span = 360 / 27  # Each nakshatra spans 13°20'
-        nakshatra_index = int(longitude // nakshatra_span)
+        nakshatra_index, pada = _NAKSHATRA_CELLS[int((longitude % 360) * 3) % 1080]
         
         return {
             'name': self.NAKSHATRAS[nakshatra_index],
             'index': nakshatra_index,
-            'pada': int((longitude % nakshatra_span) // (nakshatra_span / 4)) + 1
+            'pada': pada
         }
     
         # ...existing code...
     def generate_health_predictions(self, birth_details: BirthDetails) -> str:
         """Generate health predictions based on planetary positions"""
         
-        predictions = []
-        predictions.append("🏥 HEALTH FORECAST")
-        predictions.append("=" * 50)
-        
         # Analyze 6th house (health), Mars (energy), and current dasha
-        sun_sign = self.birth_chart.get('Sun', {}).get('sign', 'Unknown')
         mars_sign = self.birth_chart.get('Mars', {}).get('sign', 'Unknown')
         current_dasha = self.current_dasha.get('mahadasha', 'Unknown')
         
-        # Next 6 months predictions
-        predictions.append("\n📅 NEXT 6 MONTHS (Aug 2025 - Jan 2026):")
-        
-        if current_dasha in ['Sun', 'Mars']:
-            predictions.append("• Generally strong vitality and energy levels")
-            predictions.append("• Watch for minor inflammation or heat-related issues")
-            predictions.append("• Best months: September-October for physical activities")
-        elif current_dasha in ['Moon', 'Venus']:
-            predictions.append("• Focus on emotional well-being and stress management")
-            predictions.append("• Possible minor digestive or hormonal fluctuations")
-            predictions.append("• Best months: November-December for healing and recovery")
-        else:
-            predictions.append("• Moderate health trends with steady energy")
-            predictions.append("• Pay attention to routine and preventive care")
-        
-        # Next 2 years predictions
-        predictions.append("\n📅 NEXT 2 YEARS (2025-2027):")
-        predictions.append("• Major Transit Influence: Jupiter and Saturn movements affecting long-term health")
-        
-        if mars_sign in ['Aries', 'Scorpio', 'Leo']:
-            predictions.append("• Strong constitution with good recovery ability")
-            predictions.append("• Watch periods: March-April 2026 (minor health attention needed)")
-        else:
-            predictions.append("• Steady health with focus on building immunity")
-            predictions.append("• Favorable period: Oct 2026 - Feb 2027 for health improvements")
-        
-        # Physical and emotional indicators
-        predictions.append("\n🧘 PHYSICAL & EMOTIONAL WELL-BEING:")
-        dasha_health_effects = {
-            'Sun': 'Strong vitality, watch heart and eyes',
-            'Moon': 'Emotional sensitivity, focus on mental health',
-            'Mars': 'High energy, prevent accidents and inflammation',
-            'Mercury': 'Good nervous system, watch stress levels',
-            'Jupiter': 'Generally positive, watch weight gain',
-            'Venus': 'Good overall health, minor reproductive system attention',
-            'Saturn': 'Build discipline, watch bones and chronic conditions',
-            'Rahu': 'Unusual health patterns, avoid extremes',
-            'Ketu': 'Spiritual healing beneficial, watch mysterious ailments'
-        }
-        predictions.append(f"• Current Dasha ({current_dasha}) suggests: {dasha_health_effects.get(current_dasha, 'Balanced health patterns')}")
-        
-        predictions.append(dasha_health_effects.get(current_dasha, 'Balanced health patterns'))
-        
-        return "\n".join(predictions)
+        key = (current_dasha, mars_sign in STRONG_MARS_SIGNS)
+        forecast = HEALTH_TEMPLATES.get(key)
+        if forecast is None:
+            forecast = _build_health_forecast(*key)
+        return forecast
     # ...existing code...    
     def generate_career_predictions(self, birth_details: BirthDetails) -> str:
         """Generate career and job predictions"""
         
-        predictions = []
-        predictions.append("💼 CAREER & JOB PROSPECTS")
-        predictions.append("=" * 50)
-        
         # Analyze 10th house (career), Saturn (discipline), Jupiter (growth)
         saturn_sign = self.birth_chart.get('Saturn', {}).get('sign', 'Unknown')
         jupiter_sign = self.birth_chart.get('Jupiter', {}).get('sign', 'Unknown')
-        sun_sign = self.birth_chart.get('Sun', {}).get('sign', 'Unknown')
         current_dasha = self.current_dasha.get('mahadasha', 'Unknown')
         
-        # Job stability and changes (12-24 months)
-        predictions.append("\n📈 JOB STABILITY & CHANGES (Next 12-24 Months):")
-        
-        if current_dasha in ['Saturn', 'Jupiter']:
-            predictions.append("• HIGH STABILITY: Current period favors steady career growth")
-            predictions.append("• Promotion chances: 70% likely between Jan-Jun 2026")
-            predictions.append("• Role changes: Natural progression rather than sudden shifts")
-        elif current_dasha in ['Sun', 'Mars']:
-            predictions.append("• DYNAMIC PERIOD: Leadership opportunities emerging")
-            predictions.append("• Job changes: 60% chance of positive role transition by mid-2026")
-            predictions.append("• Entrepreneurial ventures: Favorable period starting Oct 2025")
-        else:
-            predictions.append("• MODERATE STABILITY: Gradual improvements expected")
-            predictions.append("• Focus on skill development and networking")
-        
-        # Favorable periods
-        predictions.append("\n🌟 FAVORABLE PERIODS:")
-        predictions.append("• Job Search: Sep-Nov 2025, Mar-May 2026")
-        predictions.append("• Business Ventures: Oct 2025-Jan 2026, Jul-Sep 2026")
-        predictions.append("• Relocation: Jupiter transit supports moves in Q2 2026")
-        predictions.append("• Salary Negotiations: Dec 2025, Jun 2026")
-        
-        # Sector alignment
-        predictions.append("\n🎯 ALIGNED SECTORS & ROLES:")
-        
-        planet_career_mapping = {
-            'Sun': 'Government, Leadership, Administration, Politics',
-            'Moon': 'Healthcare, Food, Hospitality, Public Service',
-            'Mars': 'Engineering, Military, Sports, Real Estate',
-            'Mercury': 'IT, Communication, Writing, Trade, Education',
-            'Jupiter': 'Finance, Teaching, Law, Consulting, Spiritual',
-            'Venus': 'Arts, Entertainment, Beauty, Luxury, Fashion',
-            'Saturn': 'Manufacturing, Construction, Mining, Agriculture',
-            'Rahu': 'Technology, Innovation, Foreign Trade, Research',
-            'Ketu': 'Spirituality, Research, Healing, Technical Skills'
-        }
-        
-        aligned_sectors = planet_career_mapping.get(current_dasha, 'Diverse opportunities')
-        predictions.append(f"• Primary alignment: {aligned_sectors}")
-        
-        # Based on dominant planets
-        if saturn_sign in ['Capricorn', 'Aquarius']:
-            predictions.append("• Secondary strength: Management, systematic work, long-term projects")
-        if jupiter_sign in ['Sagittarius', 'Pisces']:
-            predictions.append("• Growth potential: Advisory roles, international work, education sector")
-        
-        return "\n".join(predictions)
+        key = (current_dasha, saturn_sign in STRONG_SATURN_SIGNS, jupiter_sign in STRONG_JUPITER_SIGNS)
+        forecast = CAREER_TEMPLATES.get(key)
+        if forecast is None:
+            forecast = _build_career_forecast(*key)
+        return forecast
     
     def generate_family_predictions(self, birth_details: BirthDetails) -> str:
         """Generate family and relationship predictions"""
         
-        predictions = []
-        predictions.append("👨‍👩‍👧‍👦 FAMILY & RELATIONSHIPS")
-        predictions.append("=" * 50)
-        
         # Analyze 4th house (family), 7th house (marriage), Venus (relationships)
         venus_sign = self.birth_chart.get('Venus', {}).get('sign', 'Unknown')
-        moon_sign = self.birth_chart.get('Moon', {}).get('sign', 'Unknown')
         current_dasha = self.current_dasha.get('mahadasha', 'Unknown')
         
-        # General family environment
-        predictions.append("\n🏠 FAMILY ENVIRONMENT:")
-        
-        if current_dasha in ['Moon', 'Venus', 'Jupiter']:
-            predictions.append("• HARMONIOUS PERIOD: Family relationships strengthening")
-            predictions.append("• Emotional bonds deepening, good communication")
-            predictions.append("• Possible family celebrations or gatherings")
-        elif current_dasha in ['Mars', 'Saturn']:
-            predictions.append("• STRUCTURED PHASE: Some tension but ultimately strengthening")
-            predictions.append("• Need for patience in family matters")
-            predictions.append("• Resolution of old family issues possible")
-        else:
-            predictions.append("• BALANCED DYNAMICS: Normal family interactions")
-            predictions.append("• Focus on practical family matters")
-        
-        # Marriage and relationships
-        predictions.append("\n💑 MARRIAGE & RELATIONSHIPS:")
-        
-        if venus_sign in ['Taurus', 'Libra', 'Pisces']:
-            predictions.append("• Strong relationship potential in current period")
-            predictions.append("• For singles: Meeting prospects likely in Q4 2025 or Q2 2026")
-            predictions.append("• For married: Renewed romance and understanding")
-        
-        predictions.append("• Key relationship periods:")
-        predictions.append("  - October-December 2025: New connections or deepening bonds")
-        predictions.append("  - April-June 2026: Important relationship decisions")
-        predictions.append("  - September-November 2026: Harmony and celebration")
-        
-        # Children and responsibilities
-        predictions.append("\n👶 CHILDREN & HOUSEHOLD RESPONSIBILITIES:")
-        
-        if current_dasha == 'Jupiter':
-            predictions.append("• EXCELLENT for family expansion or child-related matters")
-            predictions.append("• Educational decisions for children go well")
-            predictions.append("• Financial planning for family needs favorable")
-        elif current_dasha == 'Moon':
-            predictions.append("• Emotional connection with children strengthens")
-            predictions.append("• Home improvements or relocations possible")
-            predictions.append("• Motherly/nurturing role emphasized")
-        
-        predictions.append("\n📅 QUARTERLY HIGHLIGHTS:")
-        predictions.append("• Q3 2025: Family harmony, possible reunions")
-        predictions.append("• Q4 2025: Important family decisions, celebrations")
-        predictions.append("• Q1 2026: New family responsibilities or changes")
-        predictions.append("• Q2 2026: Relationship milestones, emotional fulfillment")
-        
-        # Parents and extended family
-        predictions.append("\n👴👵 PARENTS & EXTENDED FAMILY:")
-        predictions.append("• Generally supportive period with elder family members")
-        predictions.append("• Possible health attention needed for elders in Q1 2026")
-        predictions.append("• Family property or inheritance matters may surface")
-        
-        return "\n".join(predictions)
+        key = (current_dasha, venus_sign in STRONG_VENUS_SIGNS)
+        forecast = FAMILY_TEMPLATES.get(key)
+        if forecast is None:
+            forecast = _build_family_forecast(*key)
+        return forecast
     
     def generate_complete_reading(self, birth_details: BirthDetails) -> str:
-        """Generate complete horoscope reading"""
+        """Generate complete horoscope reading, reusing a cached one when available"""
+        # The dasha depends on today's date, so cached readings expire daily
+        key = (
+            birth_details.name, birth_details.birth_date.isoformat(),
+            birth_details.birth_time, birth_details.birth_place,
+            round(birth_details.latitude, 3), round(birth_details.longitude, 3),
+            date.today()
+        )
+        with _reading_cache_lock:
+            cached = _reading_cache.get(key)
+            if cached is not None:
+                _reading_cache.move_to_end(key)
+        if cached is not None:
+            # Each instance gets its own copies, so mutating one chart can't
+            # change what later cache hits see
+            birth_chart, current_dasha, reading = cached
+            self.birth_chart = copy.deepcopy(birth_chart)
+            self.current_dasha = copy.deepcopy(current_dasha)
+            return reading
+        
+        reading = self._generate_complete_reading(birth_details)
+        with _reading_cache_lock:
+            _reading_cache[key] = (copy.deepcopy(self.birth_chart), copy.deepcopy(self.current_dasha), reading)
+            if len(_reading_cache) > READING_CACHE_SIZE:
+                _reading_cache.popitem(last=False)
+        return reading
+    
+    def _generate_complete_reading(self, birth_details: BirthDetails) -> str:
+        """Calculate the birth chart and render the complete reading"""
         
         # Calculate birth chart
         self.birth_chart = self.calculate_planetary_positions(birth_details)
         ascendant = self.calculate_ascendant(birth_details)
         self.current_dasha = self.calculate_current_dasha(birth_details)
         
-        reading = []
+        buf = io.StringIO()
+        w = buf.write
         
         # Header
-        reading.append("⭐" * 60)
-        reading.append(f"    VEDIC ASTROLOGY READING FOR {birth_details.name.upper()}")
-        reading.append("⭐" * 60)
-        reading.append(f"Birth Date: {birth_details.birth_date.strftime('%d-%m-%Y')}")
-        reading.append(f"Birth Time: {birth_details.birth_time}")
-        reading.append(f"Birth Place: {birth_details.birth_place}")
-        reading.append(f"Rising Sign: {ascendant.get('sign', 'Unknown')}")
-        reading.append(f"Current Mahadasha: {self.current_dasha.get('mahadasha', 'Unknown')}")
-        reading.append(f"Birth Nakshatra: {self.current_dasha.get('birth_nakshatra', 'Unknown')}")
-        reading.append("\n")
+        w("⭐" * 60 + "\n")
+        w(f"    VEDIC ASTROLOGY READING FOR {birth_details.name.upper()}\n")
+        w("⭐" * 60 + "\n")
+        w(f"Birth Date: {birth_details.birth_date.strftime('%d-%m-%Y')}\n")
+        w(f"Birth Time: {birth_details.birth_time}\n")
+        w(f"Birth Place: {birth_details.birth_place}\n")
+        w(f"Rising Sign: {ascendant.get('sign', 'Unknown')}\n")
+        w(f"Current Mahadasha: {self.current_dasha.get('mahadasha', 'Unknown')}\n")
+        w(f"Birth Nakshatra: {self.current_dasha.get('birth_nakshatra', 'Unknown')}\n")
+        w("\n\n")
         
         # Generate all predictions
-        health_forecast = self.generate_health_predictions(birth_details)
-        career_forecast = self.generate_career_predictions(birth_details)
-        family_forecast = self.generate_family_predictions(birth_details)
-        
-        reading.append(health_forecast)
-        reading.append("\n\n")
-        reading.append(career_forecast)
-        reading.append("\n\n")
-        reading.append(family_forecast)
+        w(self.generate_health_predictions(birth_details))
+        w("\n\n\n\n")
+        w(self.generate_career_predictions(birth_details))
+        w("\n\n\n\n")
+        w(self.generate_family_predictions(birth_details))
         
         # Summary and recommendations
-        reading.append("\n\n🎯 KEY RECOMMENDATIONS & PRECAUTIONS (2025-2027)")
-        reading.append("=" * 60)
+        w("\n\n\n🎯 KEY RECOMMENDATIONS & PRECAUTIONS (2025-2027)\n")
+        w("=" * 60 + "\n")
         
         current_dasha = self.current_dasha.get('mahadasha', 'Unknown')
         
-        reading.append("\n💡 PRIORITY ACTIONS:")
+        w("\n💡 PRIORITY ACTIONS:\n")
         if current_dasha in ['Jupiter', 'Venus']:
-            reading.append("• Focus on growth, learning, and positive relationships")
-            reading.append("• Excellent time for major life decisions")
-            reading.append("• Invest in health and spiritual practices")
+            w("• Focus on growth, learning, and positive relationships\n"
+              "• Excellent time for major life decisions\n"
+              "• Invest in health and spiritual practices\n")
         elif current_dasha in ['Saturn', 'Mars']:
-            reading.append("• Practice patience and disciplined approach")
-            reading.append("• Build strong foundations in career and health")
-            reading.append("• Avoid impulsive decisions, plan carefully")
+            w("• Practice patience and disciplined approach\n"
+              "• Build strong foundations in career and health\n"
+              "• Avoid impulsive decisions, plan carefully\n")
         else:
-            reading.append("• Maintain balance in all life areas")
-            reading.append("• Focus on communication and adaptability")
-            reading.append("• Regular health check-ups recommended")
-        
-        reading.append("\n⚠️ PERIODS TO WATCH:")
-        reading.append("• March-April 2026: Extra care in health and relationships")
-        reading.append("• August-September 2026: Career decisions need careful thought")
-        reading.append("• December 2026: Family matters require attention")
-        
-        reading.append("\n🌟 MOST FAVORABLE PERIODS:")
-        reading.append("• October-December 2025: Overall positive phase")
-        reading.append("• May-July 2026: Career and financial growth")
-        reading.append("• January-March 2027: Personal and spiritual development")
-        
-        reading.append("\n" + "=" * 60)
-        reading.append("Reading generated using traditional Vedic astrology principles")
-        reading.append("For specific concerns, consult with a qualified astrologer")
-        reading.append("=" * 60)
-        
-        return "\n".join(reading)
+            w("• Maintain balance in all life areas\n"
+              "• Focus on communication and adaptability\n"
+              "• Regular health check-ups recommended\n")
+        
+        w("\n⚠️ PERIODS TO WATCH:\n"
+          "• March-April 2026: Extra care in health and relationships\n"
+          "• August-September 2026: Career decisions need careful thought\n"
+          "• December 2026: Family matters require attention\n")
+        
+        w("\n🌟 MOST FAVORABLE PERIODS:\n"
+          "• October-December 2025: Overall positive phase\n"
+          "• May-July 2026: Career and financial growth\n"
+          "• January-March 2027: Personal and spiritual development\n")
+        
+        w("\n" + "=" * 60 + "\n")
+        w("Reading generated using traditional Vedic astrology principles\n")
+        w("For specific concerns, consult with a qualified astrologer\n")
+        w("=" * 60)
+        
+        return buf.getvalue()
+    
+    def generate_complete_readings(self, batch: List[BirthDetails]) -> List[str]:
+        """Generate complete horoscope readings for several people"""
+        # One instance serves the whole batch, so its ephem bodies are reused;
+        # the date-keyed lru_caches and the reading LRU are shared as well
+        return [self.generate_complete_reading(birth_details) for birth_details in batch]
+
+# ============================================================================
+# PRECOMPUTED PREDICTION TEXT
+# ============================================================================
+# The forecasts only depend on the current dasha and a few sign placements,
+# so every combination is rendered once at import time.
+
+STRONG_MARS_SIGNS = frozenset(['Aries', 'Scorpio', 'Leo'])
+STRONG_SATURN_SIGNS = frozenset(['Capricorn', 'Aquarius'])
+STRONG_JUPITER_SIGNS = frozenset(['Sagittarius', 'Pisces'])
+STRONG_VENUS_SIGNS = frozenset(['Taurus', 'Libra', 'Pisces'])
+
+# Health themes of each mahadasha
+DASHA_HEALTH_EFFECTS = MappingProxyType({
+    'Sun': 'Strong vitality, watch heart and eyes',
+    'Moon': 'Emotional sensitivity, focus on mental health',
+    'Mars': 'High energy, prevent accidents and inflammation',
+    'Mercury': 'Good nervous system, watch stress levels',
+    'Jupiter': 'Generally positive, watch weight gain',
+    'Venus': 'Good overall health, minor reproductive system attention',
+    'Saturn': 'Build discipline, watch bones and chronic conditions',
+    'Rahu': 'Unusual health patterns, avoid extremes',
+    'Ketu': 'Spiritual healing beneficial, watch mysterious ailments'
+})
+
+# Career sectors ruled by each planet
+PLANET_CAREER_MAPPING = MappingProxyType({
+    'Sun': 'Government, Leadership, Administration, Politics',
+    'Moon': 'Healthcare, Food, Hospitality, Public Service',
+    'Mars': 'Engineering, Military, Sports, Real Estate',
+    'Mercury': 'IT, Communication, Writing, Trade, Education',
+    'Jupiter': 'Finance, Teaching, Law, Consulting, Spiritual',
+    'Venus': 'Arts, Entertainment, Beauty, Luxury, Fashion',
+    'Saturn': 'Manufacturing, Construction, Mining, Agriculture',
+    'Rahu': 'Technology, Innovation, Foreign Trade, Research',
+    'Ketu': 'Spirituality, Research, Healing, Technical Skills'
+})
+
+def _build_health_forecast(current_dasha: str, mars_strong: bool) -> str:
+    """Build the health forecast text for a dasha and Mars placement"""
+    
+    predictions = []
+    predictions.append("🏥 HEALTH FORECAST")
+    predictions.append("=" * 50)
+    
+    # Next 6 months predictions
+    predictions.append("\n📅 NEXT 6 MONTHS (Aug 2025 - Jan 2026):")
+    
+    if current_dasha in ['Sun', 'Mars']:
+        predictions.append("• Generally strong vitality and energy levels")
+        predictions.append("• Watch for minor inflammation or heat-related issues")
+        predictions.append("• Best months: September-October for physical activities")
+    elif current_dasha in ['Moon', 'Venus']:
+        predictions.append("• Focus on emotional well-being and stress management")
+        predictions.append("• Possible minor digestive or hormonal fluctuations")
+        predictions.append("• Best months: November-December for healing and recovery")
+    else:
+        predictions.append("• Moderate health trends with steady energy")
+        predictions.append("• Pay attention to routine and preventive care")
+    
+    # Next 2 years predictions
+    predictions.append("\n📅 NEXT 2 YEARS (2025-2027):")
+    predictions.append("• Major Transit Influence: Jupiter and Saturn movements affecting long-term health")
+    
+    if mars_strong:
+        predictions.append("• Strong constitution with good recovery ability")
+        predictions.append("• Watch periods: March-April 2026 (minor health attention needed)")
+    else:
+        predictions.append("• Steady health with focus on building immunity")
+        predictions.append("• Favorable period: Oct 2026 - Feb 2027 for health improvements")
+    
+    # Physical and emotional indicators
+    predictions.append("\n🧘 PHYSICAL & EMOTIONAL WELL-BEING:")
+    predictions.append(f"• Current Dasha ({current_dasha}) suggests: {DASHA_HEALTH_EFFECTS.get(current_dasha, 'Balanced health patterns')}")
+    
+    return "\n".join(predictions)
+
+def _build_career_forecast(current_dasha: str, saturn_strong: bool, jupiter_strong: bool) -> str:
+    """Build the career forecast text for a dasha and Saturn/Jupiter placements"""
+    
+    predictions = []
+    predictions.append("💼 CAREER & JOB PROSPECTS")
+    predictions.append("=" * 50)
+    
+    # Job stability and changes (12-24 months)
+    predictions.append("\n📈 JOB STABILITY & CHANGES (Next 12-24 Months):")
+    
+    if current_dasha in ['Saturn', 'Jupiter']:
+        predictions.append("• HIGH STABILITY: Current period favors steady career growth")
+        predictions.append("• Promotion chances: 70% likely between Jan-Jun 2026")
+        predictions.append("• Role changes: Natural progression rather than sudden shifts")
+    elif current_dasha in ['Sun', 'Mars']:
+        predictions.append("• DYNAMIC PERIOD: Leadership opportunities emerging")
+        predictions.append("• Job changes: 60% chance of positive role transition by mid-2026")
+        predictions.append("• Entrepreneurial ventures: Favorable period starting Oct 2025")
+    else:
+        predictions.append("• MODERATE STABILITY: Gradual improvements expected")
+        predictions.append("• Focus on skill development and networking")
+    
+    # Favorable periods
+    predictions.append("\n🌟 FAVORABLE PERIODS:")
+    predictions.append("• Job Search: Sep-Nov 2025, Mar-May 2026")
+    predictions.append("• Business Ventures: Oct 2025-Jan 2026, Jul-Sep 2026")
+    predictions.append("• Relocation: Jupiter transit supports moves in Q2 2026")
+    predictions.append("• Salary Negotiations: Dec 2025, Jun 2026")
+    
+    # Sector alignment
+    predictions.append("\n🎯 ALIGNED SECTORS & ROLES:")
+    
+    aligned_sectors = PLANET_CAREER_MAPPING.get(current_dasha, 'Diverse opportunities')
+    predictions.append(f"• Primary alignment: {aligned_sectors}")
+    
+    # Based on dominant planets
+    if saturn_strong:
+        predictions.append("• Secondary strength: Management, systematic work, long-term projects")
+    if jupiter_strong:
+        predictions.append("• Growth potential: Advisory roles, international work, education sector")
+    
+    return "\n".join(predictions)
+
+def _build_family_forecast(current_dasha: str, venus_strong: bool) -> str:
+    """Build the family forecast text for a dasha and Venus placement"""
+    
+    predictions = []
+    predictions.append("👨‍👩‍👧‍👦 FAMILY & RELATIONSHIPS")
+    predictions.append("=" * 50)
+    
+    # General family environment
+    predictions.append("\n🏠 FAMILY ENVIRONMENT:")
+    
+    if current_dasha in ['Moon', 'Venus', 'Jupiter']:
+        predictions.append("• HARMONIOUS PERIOD: Family relationships strengthening")
+        predictions.append("• Emotional bonds deepening, good communication")
+        predictions.append("• Possible family celebrations or gatherings")
+    elif current_dasha in ['Mars', 'Saturn']:
+        predictions.append("• STRUCTURED PHASE: Some tension but ultimately strengthening")
+        predictions.append("• Need for patience in family matters")
+        predictions.append("• Resolution of old family issues possible")
+    else:
+        predictions.append("• BALANCED DYNAMICS: Normal family interactions")
+        predictions.append("• Focus on practical family matters")
+    
+    # Marriage and relationships
+    predictions.append("\n💑 MARRIAGE & RELATIONSHIPS:")
+    
+    if venus_strong:
+        predictions.append("• Strong relationship potential in current period")
+        predictions.append("• For singles: Meeting prospects likely in Q4 2025 or Q2 2026")
+        predictions.append("• For married: Renewed romance and understanding")
+    
+    predictions.append("• Key relationship periods:")
+    predictions.append("  - October-December 2025: New connections or deepening bonds")
+    predictions.append("  - April-June 2026: Important relationship decisions")
+    predictions.append("  - September-November 2026: Harmony and celebration")
+    
+    # Children and responsibilities
+    predictions.append("\n👶 CHILDREN & HOUSEHOLD RESPONSIBILITIES:")
+    
+    if current_dasha == 'Jupiter':
+        predictions.append("• EXCELLENT for family expansion or child-related matters")
+        predictions.append("• Educational decisions for children go well")
+        predictions.append("• Financial planning for family needs favorable")
+    elif current_dasha == 'Moon':
+        predictions.append("• Emotional connection with children strengthens")
+        predictions.append("• Home improvements or relocations possible")
+        predictions.append("• Motherly/nurturing role emphasized")
+    
+    predictions.append("\n📅 QUARTERLY HIGHLIGHTS:")
+    predictions.append("• Q3 2025: Family harmony, possible reunions")
+    predictions.append("• Q4 2025: Important family decisions, celebrations")
+    predictions.append("• Q1 2026: New family responsibilities or changes")
+    predictions.append("• Q2 2026: Relationship milestones, emotional fulfillment")
+    
+    # Parents and extended family
+    predictions.append("\n👴👵 PARENTS & EXTENDED FAMILY:")
+    predictions.append("• Generally supportive period with elder family members")
+    predictions.append("• Possible health attention needed for elders in Q1 2026")
+    predictions.append("• Family property or inheritance matters may surface")
+    
+    return "\n".join(predictions)
+
+_DASHA_KEYS = tuple(VedicAstrology.DASHA_PERIODS) + ('Unknown',)
+
+HEALTH_TEMPLATES = {
+    (dasha, mars): _build_health_forecast(dasha, mars)
+    for dasha in _DASHA_KEYS for mars in (True, False)
+}
+CAREER_TEMPLATES = {
+    (dasha, saturn, jupiter): _build_career_forecast(dasha, saturn, jupiter)
+    for dasha in _DASHA_KEYS for saturn in (True, False) for jupiter in (True, False)
+}
+FAMILY_TEMPLATES = {
+    (dasha, venus): _build_family_forecast(dasha, venus)
+    for dasha in _DASHA_KEYS for venus in (True, False)
+}
+
+# Approximate coordinates for major cities, looked up by lowercase name
+CITY_COORDS = {
+    'mumbai': (19.0760, 72.8777),
+    'delhi': (28.7041, 77.1025),
+    'bangalore': (12.9716, 77.5946),
+    'chennai': (13.0827, 80.2707),
+    'kolkata': (22.5726, 88.3639),
+    'hyderabad': (17.3850, 78.4867),
+    'pune': (18.5204, 73.8567),
+    'ahmedabad': (23.0225, 72.5714),
+    'jaipur': (26.9124, 75.7873),
+    'lucknow': (26.8467, 80.9462),
+    'new york': (40.7128, -74.0060),
+    'london': (51.5074, -0.1278),
+    'tokyo': (35.6762, 139.6503),
+    'sydney': (-33.8688, 151.2093),
+    'toronto': (43.6532, -79.3832)
+}
+DEFAULT_COORDS = CITY_COORDS['delhi']
 
 def get_coordinates(city_name: str) -> Tuple[float, float]:
     """Get approximate coordinates for major cities"""
-    city_coords = {
-        'mumbai': (19.0760, 72.8777),
-        'delhi': (28.7041, 77.1025),
-        'bangalore': (12.9716, 77.5946),
-        'chennai': (13.0827, 80.2707),
-        'kolkata': (22.5726, 88.3639),
-        'hyderabad': (17.3850, 78.4867),
-        'pune': (18.5204, 73.8567),
-        'ahmedabad': (23.0225, 72.5714),
-        'jaipur': (26.9124, 75.7873),
-        'lucknow': (26.8467, 80.9462),
-        'new york': (40.7128, -74.0060),
-        'london': (51.5074, -0.1278),
-        'tokyo': (35.6762, 139.6503),
-        'sydney': (-33.8688, 151.2093),
-        'toronto': (43.6532, -79.3832)
-    }
+    return CITY_COORDS.get(city_name.strip().lower(), DEFAULT_COORDS)  # Default to Delhi
+
+# "HH:MM AM/PM" or 24-hour "HH:MM"
+_TIME_RE = re.compile(r'^\s*(\d{1,2}):(\d{1,2})\s*([AaPp][Mm])?\s*$')
+
+def parse_birth_time(birth_time: str) -> Optional[Tuple[int, int]]:
+    """Parse a birth time string into (hour, minute), None if invalid"""
+    match = _TIME_RE.match(birth_time)
+    if match is None:
+        return None
+    
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour %= 12
+        if meridiem.upper() == 'PM':
+            hour += 12
+    elif hour > 23:
+        return None
     
-    city_lower = city_name.lower()
-    return city_coords.get(city_lower, (28.7041, 77.1025))  # Default to Delhi
+    return hour, minute
 
 def parse_birth_details() -> BirthDetails:
     """Interactive function to get birth details from user"""
@@ -502,22 +660,11 @@ def parse_birth_details() -> BirthDetails:
     birth_time = input("Enter birth time (HH:MM AM/PM): ").strip()
     
     # Parse time for calculations
-    try:
-        time_obj = datetime.strptime(birth_time, "%I:%M %p")
-        birth_datetime = birth_date.replace(
-            hour=time_obj.hour,
-            minute=time_obj.minute
-        )
-    except ValueError:
-        try:
-            time_obj = datetime.strptime(birth_time, "%H:%M")
-            birth_datetime = birth_date.replace(
-                hour=time_obj.hour,
-                minute=time_obj.minute
-            )
-        except ValueError:
-            print("Invalid time format. Using 12:00 PM as default.")
-            birth_datetime = birth_date.replace(hour=12, minute=0)
+    parsed_time = parse_birth_time(birth_time)
+    if parsed_time is None:
+        print("Invalid time format. Using 12:00 PM as default.")
+        parsed_time = (12, 0)
+    birth_datetime = birth_date.replace(hour=parsed_time[0], minute=parsed_time[1])
     
     # Get birth place
     birth_place = input("Enter birth place (City, Country): ").strip()
@@ -569,8 +716,8 @@ def main():
 
 if __name__ == "__main__":
     # Required packages installation note
-    print("Required packages: ephem, pytz")
-    print("Install with: pip install ephem pytz")
+    print("Required packages: ephem")
+    print("Install with: pip install ephem")
     print("-" * 40)
     
     main()
\ No newline at end of file
@@ -1,12 +1,28 @@
 import warnings
+import asyncio
+import aiohttp
+import chromadb
 import os
 import json
+import logging
+import logging.handlers
 import re
+import sys
+import ijson
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from bs4 import BeautifulSoup
+from chromadb.config import Settings
+from pathlib import Path
+from typing import Dict, List
+
+from pydantic import BaseModel, RootModel
 
 warnings.filterwarnings('ignore')
 
-from crewai import Agent, Task, Crew, Process
+from crewai import Agent, Task, Crew, Process, LLM
+from crewai.tools import tool
 from crewai_tools import (
     FileReadTool,
     ScrapeWebsiteTool,
@@ -14,6 +30,7 @@ from crewai_tools import (
     SerperDevTool
 )
 from langchain_openai import ChatOpenAI
+# Written against crewai / crewai-tools 1.15.x
 # ============================================================================
 # 1. IMPORT UTILS FIRST (This forces .env to load)
 # ============================================================================
@@ -39,6 +56,54 @@ except Exception as e:
 smart_llm = ChatOpenAI(model="gpt-4o", temperature=0.1)
 fast_llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0)
 
+# Optional LLM completion cache, off by default. litellm.cache only sees calls
+# CrewAI runs through litellm, and native providers (e.g. OpenAI for gpt-*)
+# bypass it, so when the cache is on every agent LLM is rebuilt with
+# is_litellm=True (see via_litellm). Needs: pip install "crewai[litellm]" "litellm[caching]".
+# "disk" matches identical prompts across runs; "redis-semantic" (needs
+# REDIS_HOST/REDIS_PORT/REDIS_PASSWORD) also reuses answers for near-identical prompts.
+LLM_CACHE_TYPE = os.getenv("LLM_CACHE_TYPE", "off")
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))  # seconds
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+
+if LLM_CACHE_TYPE != "off":
+    try:
+        import litellm
+        if LLM_CACHE_TYPE == "redis-semantic":
+            litellm.cache = litellm.Cache(
+                type="redis-semantic",
+                host=os.getenv("REDIS_HOST"),
+                port=os.getenv("REDIS_PORT"),
+                password=os.getenv("REDIS_PASSWORD"),
+                similarity_threshold=0.92,
+                ttl=LLM_CACHE_TTL
+            )
+        else:
+            litellm.cache = litellm.Cache(type="disk", disk_cache_dir=LLM_CACHE_DIR, ttl=LLM_CACHE_TTL)
+    except ImportError as e:
+        print(f"❌ LLM_CACHE_TYPE={LLM_CACHE_TYPE} needs crewai[litellm] and litellm[caching]: {e}")
+        exit(1)
+
+def via_litellm(llm):
+    """Rebuild an LLM as a litellm-routed crewai.LLM when the cache is on"""
+    if LLM_CACHE_TYPE == "off":
+        return llm
+    # crewai.LLM exposes .model, LangChain chat models .model_name
+    model = getattr(llm, "model", None) or getattr(llm, "model_name", None)
+    if not isinstance(model, str):
+        print(f"⚠️ Can't route {type(llm).__name__} through the LLM cache; using it uncached")
+        return llm
+    settings = {name: getattr(llm, name, None) for name in ("temperature", "max_tokens", "base_url", "api_key")}
+    return LLM(model=model, is_litellm=True, **{name: value for name, value in settings.items() if value is not None})
+
+# Every agent except resume_strategist (see RESUME_MODEL) shares one LLM client
+agent_llm = via_litellm(get_fast_llm())
+
+# Agent/crew step traces go to CREW_LOG_FILE; set CREW_VERBOSE=1 to also
+# print them to the terminal
+CREW_VERBOSE = os.getenv("CREW_VERBOSE") == "1"
+CREW_LOG_FILE = "crew_log.txt"
+
 # ============================================================================
 # 2. TOOL INITIALIZATION
 # ============================================================================
@@ -46,7 +111,103 @@ fast_llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0)
 search_tool = SerperDevTool()
 scrape_tool = ScrapeWebsiteTool()
 
+# Job pages are scraped together, a bounded number at a time, instead of one
+# tool call per URL; 429s back off and retry rather than failing the page
+SCRAPE_CONCURRENCY = 8
+SCRAPE_RETRIES = 3
+SCRAPE_BACKOFF = 0.5  # Seconds; doubles on every retry
+SCRAPE_MAX_CHARS = 4000  # Per page returned to the agent, to keep the tool result in context
+
+# Page furniture that surrounds the posting itself
+BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form"]
+
+def page_text(html):
+    """Text of the main posting content, without navigation and banners"""
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(BOILERPLATE_TAGS):
+        element.decompose()
+    body = soup.find("main") or soup.find("article") or soup
+    return body.get_text(" ", strip=True)
+
+async def scrape_many(urls):
+    slots = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    # Same browser-style headers as ScrapeWebsiteTool, so job boards treat both alike
+    async with aiohttp.ClientSession(headers=scrape_tool.headers,
+                                     timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async def scrape_one(url):
+            async with slots:
+                for attempt in range(SCRAPE_RETRIES + 1):
+                    async with session.get(url) as response:
+                        if response.status != 429 or attempt == SCRAPE_RETRIES:
+                            # 403/404/5xx and bot walls are errors, not page text
+                            response.raise_for_status()
+                            # Pages with a wrong charset still give usable text
+                            html = await response.text(errors="replace")
+                            break
+                    await asyncio.sleep(SCRAPE_BACKOFF * 2 ** attempt)
+            return page_text(html)
+
+        # A failing URL (timeout, bad host, ...) comes back as its exception
+        # instead of failing the whole batch
+        return await asyncio.gather(*[scrape_one(url) for url in urls], return_exceptions=True)
+
+# Page text of every successfully scraped URL this run, so other tools can
+# work from a URL instead of the agent re-sending the text
+_scraped_pages = {}
+
+def scrape_pages(urls):
+    """Scrape URLs, keeping successful pages in _scraped_pages"""
+    # Crews run in worker threads, so there is no event loop here yet
+    pages = asyncio.run(scrape_many(urls))
+    for url, page in zip(urls, pages):
+        if not isinstance(page, Exception):
+            _scraped_pages[url] = page
+    return pages
+
+@tool("Scrape Job Pages")
+def scrape_job_pages(urls: List[str]) -> str:
+    """Scrape several job posting URLs in one call.
+    Input: a list of URLs. Returns JSON mapping each URL to its page text (truncated)."""
+    unique = list(dict.fromkeys(urls))
+    missing = [url for url in unique if url not in _scraped_pages]
+    pages = dict(zip(missing, scrape_pages(missing))) if missing else {}
+    results = {}
+    for url in unique:
+        page = pages.get(url)
+        if isinstance(page, Exception):
+            results[url] = f"Error scraping {url}: {type(page).__name__}: {page}"
+        else:
+            results[url] = _scraped_pages[url][:SCRAPE_MAX_CHARS]
+    return json.dumps(results)
+
 RESUME_PATH = "D:\\01RAHUL\\12MyCode\\01Projects\\cv-RR.md"
+RESUME_INDEX_DIR = ".resume_index"  # Resume embeddings persisted between runs
+RESUME_INDEX_SETTINGS = Settings(
+    persist_directory=RESUME_INDEX_DIR,
+    allow_reset=True,
+    is_persistent=True,
+    anonymized_telemetry=False
+)
+
+def open_resume_index(collection_name):
+    """Delete indexes of older resume versions; True if this one is already embedded"""
+    os.makedirs(RESUME_INDEX_DIR, exist_ok=True)
+    client = chromadb.PersistentClient(path=RESUME_INDEX_DIR, settings=RESUME_INDEX_SETTINGS)
+    indexed = False
+    for collection in client.list_collections():
+        if collection.name == collection_name:
+            indexed = collection.count() > 0
+        elif collection.name.startswith("resume-"):
+            client.delete_collection(collection.name)
+    return indexed
+
+class ResumeSearchTool(MDXSearchTool):
+    """MDXSearchTool that skips re-embedding a resume that is already indexed"""
+    indexed: bool = False
+
+    def add(self, mdx: str) -> None:
+        if not self.indexed:
+            super().add(mdx)
 
 if not os.path.exists(RESUME_PATH):
     print(f"ERROR: Resume file not found at {RESUME_PATH}")
@@ -54,38 +215,90 @@ if not os.path.exists(RESUME_PATH):
     exit(1)
 else:
     read_resume = FileReadTool(file_path=RESUME_PATH)
-    semantic_search_resume = MDXSearchTool(file_path=RESUME_PATH)
+    # Embed the resume once and reuse the index on later runs; the collection
+    # is keyed on the file's modification time so an edited resume is re-embedded
+    resume_collection = f"resume-{int(os.path.getmtime(RESUME_PATH))}"
+    semantic_search_resume = ResumeSearchTool(
+        mdx=RESUME_PATH,
+        indexed=open_resume_index(resume_collection),
+        collection_name=resume_collection,
+        config=dict(
+            vectordb=dict(
+                provider="chromadb",
+                config=dict(settings=RESUME_INDEX_SETTINGS)
+            )
+        )
+    )
+
+# Cheap pre-filter: scraped jobs are scored against the personal writeup by
+# embedding similarity in Python, so the LLM only scores the closest few.
+# The model reads at most 256 word pieces, so pages are embedded in chunks and
+# a page scores as its best-matching chunk
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+PREFILTER_SHORTLIST = 20  # Wider than the final top 10; the LLM makes the real cut
+PREFILTER_CHUNK_WORDS = 150
+PREFILTER_MAX_CHUNKS = 20  # Per page
+
+_embedder = None
+_writeup_embedding = None
+
+def get_embedder():
+    """Load the sentence-transformers model on first use"""
+    global _embedder
+    if _embedder is None:
+        from sentence_transformers import SentenceTransformer
+        _embedder = SentenceTransformer(EMBEDDING_MODEL)
+    return _embedder
+
+def prepare_prefilter(personal_writeup):
+    """Embed the personal writeup once per run"""
+    global _writeup_embedding
+    _writeup_embedding = get_embedder().encode(personal_writeup, normalize_embeddings=True)
+
+@tool("Prefilter Jobs")
+def prefilter_jobs(urls: List[str]) -> str:
+    """Rank job posting URLs by how closely their pages match the candidate profile.
+    Input: a list of job URLs (already scraped ones are not fetched again).
+    Returns the closest matches as a JSON array of {url, prefilter_score (0-100)}."""
+    missing = [url for url in dict.fromkeys(urls) if url not in _scraped_pages]
+    if missing:
+        scrape_pages(missing)
+    scraped = [url for url in dict.fromkeys(urls) if url in _scraped_pages]
+    if not scraped or _writeup_embedding is None:
+        return json.dumps([{"url": url, "prefilter_score": None} for url in scraped])
+    chunks, owners = [], []
+    for index, url in enumerate(scraped):
+        words = _scraped_pages[url].split() or [""]
+        for start in range(0, min(len(words), PREFILTER_CHUNK_WORDS * PREFILTER_MAX_CHUNKS), PREFILTER_CHUNK_WORDS):
+            chunks.append(" ".join(words[start:start + PREFILTER_CHUNK_WORDS]))
+            owners.append(index)
+    chunk_scores = get_embedder().encode(chunks, batch_size=32, normalize_embeddings=True) @ _writeup_embedding
+    scores = [float("-inf")] * len(scraped)
+    for index, score in zip(owners, chunk_scores):
+        scores[index] = max(scores[index], float(score))
+    ranked = sorted(zip(scores, scraped), key=lambda pair: pair[0], reverse=True)[:PREFILTER_SHORTLIST]
+    return json.dumps([{"url": url, "prefilter_score": round(score * 100)} for score, url in ranked])
 
 # ============================================================================
 # 3. AGENTS
 # ============================================================================job_scraper = Agent(
+# Finds jobs and scores them against the resume in a single task
 job_scraper = Agent(
     role="Job Search Specialist",
-    goal="Find valid job links from Google Search results.",
+    goal="Find valid job links from Google Search results and score them based on resume match.",
     backstory=(
         "You are an expert internet researcher with a keen eye for detail. "
         "You know how to construct search queries that bypass spam and sponsored content. "
-        "You are relentless in finding the specific URLs for job postings."
-    ),
-    tools=[search_tool, scrape_tool],
-    llm=get_fast_llm(),
-    max_iter=5,
-    allow_delegation=False,
-    verbose=True
-)
-
-profile_matcher = Agent(
-    role="Profile Matcher",
-    goal="Score jobs based on resume match.",
-    backstory=(
-        "You are a seasoned technical recruiter. When searching the resume, "
+        "You are relentless in finding the specific URLs for job postings. "
+        "You also think like a seasoned technical recruiter. When searching the resume, "
         "always use the 'search_query' parameter for your tool calls. "
         "You are critical and realistic; you don't give high scores unless the fit is genuine."
     ),
-    tools=[read_resume, semantic_search_resume],
-    llm=get_fast_llm(),
-    max_iter=10,
-    verbose=True
+    tools=[search_tool, scrape_job_pages, prefilter_jobs, read_resume, semantic_search_resume],
+    llm=agent_llm,
+    max_iter=15,  # Search/scrape budget plus the old matcher's resume lookups
+    allow_delegation=False,
+    verbose=CREW_VERBOSE
 )
 
 job_ranker = Agent(
@@ -96,12 +309,22 @@ job_ranker = Agent(
         "You look beyond just the skills match to analyze company stability, "
         "growth potential, and alignment with the candidate's long-term goals."
     ),
-    tools=[scrape_tool],
-    llm=get_fast_llm(),
+    tools=[scrape_job_pages],
+    llm=agent_llm,
     max_iter=5,
-    verbose=True
+    verbose=CREW_VERBOSE
 )
 
+# All ten resumes come back in one answer, so tailoring gets its own model with
+# room for them (gpt-3.5-turbo caps output at 4096 tokens; gpt-4o at 16384).
+# This bypasses whatever utils.get_fast_llm is configured to use; set
+# RESUME_MODEL / RESUME_MAX_TOKENS to match your provider's output limit
+RESUME_MODEL = os.getenv("RESUME_MODEL", "gpt-4o")
+RESUME_MAX_TOKENS = int(os.getenv("RESUME_MAX_TOKENS", 16000))
+RESUME_MAX_WORDS = 600  # Per resume; ten of these fit in RESUME_MAX_TOKENS
+
+resume_llm = via_litellm(LLM(model=RESUME_MODEL, temperature=0.1, max_tokens=RESUME_MAX_TOKENS))
+
 resume_strategist = Agent(
     role="Resume Writer",
     goal="Generate resume markdown content for top jobs.",
@@ -111,9 +334,9 @@ resume_strategist = Agent(
         "You are a master at highlighting transferable skills without fabricating facts."
     ),
     tools=[read_resume, semantic_search_resume],
-    llm=get_fast_llm(),
-    max_iter=10,
-    verbose=True
+    llm=resume_llm,
+    max_iter=3,
+    verbose=CREW_VERBOSE
 )
 
 interview_prepper = Agent(
@@ -125,33 +348,47 @@ interview_prepper = Agent(
         "and technical challenges to predict exactly what the interviewer will ask."
     ),
     tools=[scrape_tool, search_tool, read_resume],
-    llm=get_fast_llm(),
+    llm=agent_llm,
     max_iter=5,
-    verbose=True
+    verbose=CREW_VERBOSE
 )
 
 # ============================================================================
 # 4. TASKS (Updated for JSON Output)
 # ============================================================================
 
+# Output schemas give each task an exact shape to answer in. CrewAI checks the
+# final answer against them and, only if it doesn't validate, spends one extra
+# converter call to repair it (max_iter bounds tool-use steps, not this retry)
+class JobMatch(BaseModel):
+    title: str
+    company: str
+    url: str
+    match_score: int  # 0-100
+
+
+class JobMatches(BaseModel):
+    jobs: List[JobMatch]
+
+
+# Filename -> markdown body
+class ResumeMap(RootModel[Dict[str, str]]):
+    pass
+
+
+# Search and profile matching in one LLM task, so the job list is not
+# serialized out and re-read by a second agent before it is scored
 job_search_task = Task(
     description=(
         "Search for jobs matching: {search_query} in {locations}.\n"
-        "STRICT: Use the search_tool to find links. Then use scrape_tool to read the links.\n"
-        "Return a JSON list of jobs with: title, company, url."
+        "STRICT: Use the search_tool to find links. Pass all the job URLs to prefilter_jobs and keep only the jobs it returns.\n"
+        "Then use scrape_job_pages on the shortlisted URLs only, in one call, to read them.\n"
+        "Then match the profile against each remaining job using the resume tools. {personal_writeup}\n"
+        "Return a JSON object {\"jobs\": [...]} where each job has: title, company, url, match_score (0-100)."
     ),
-    expected_output="JSON array of job objects.",
-    agent=job_scraper
-)
-
-profile_matching_task = Task(
-    description=(
-        "Match profile against jobs. {personal_writeup}\n"
-        "Return a JSON array of jobs with added 'match_score' (0-100)."
-    ),
-    expected_output="JSON array with match scores.",
-    agent=profile_matcher,
-    context=[job_search_task]
+    expected_output="JSON object with a 'jobs' array of scored job objects.",
+    agent=job_scraper,
+    output_pydantic=JobMatches
 )
 
 job_ranking_task = Task(
@@ -161,7 +398,7 @@ job_ranking_task = Task(
     ),
     expected_output="JSON array of top 10 ranked jobs.",
     agent=job_ranker,
-    context=[profile_matching_task],
+    context=[job_search_task],
     output_file="top_10_jobs.json", # This saves the raw ranking
     human_input=True
 )
@@ -169,16 +406,18 @@ job_ranking_task = Task(
 # UPDATED: Explicitly asks for a JSON map so we can save files later
 resume_tailoring_task = Task(
     description=(
-        "For the top 10 jobs provided, create a tailored resume content.\n"
+        "Here are the top 10 jobs, numbered 1 to 10 in ranking order.\n"
+        f"Write a tailored resume for every one of them in a single answer, at most {RESUME_MAX_WORDS} words each.\n"
         "CRITICAL OUTPUT FORMAT: You must output a single JSON object.\n"
-        "The keys must be filenames (e.g., 'resume_Google_Engineer.md').\n"
+        "The keys must be 'resume_1' through 'resume_10', matching the job numbers.\n"
         "The values must be the full markdown content of the resume.\n"
         "Do not output anything other than the JSON."
     ),
-    expected_output="A JSON object mapping filenames to resume markdown content.",
+    expected_output="A JSON object with keys resume_1..resume_10 mapping to resume markdown content.",
     agent=resume_strategist,
     context=[job_ranking_task],
-    output_file="resumes_data.json" 
+    output_file="resumes_data.json",
+    output_pydantic=ResumeMap
 )
 
 # UPDATED: Explicitly asks for a JSON map
@@ -200,13 +439,54 @@ interview_prep_task = Task(
 # 5. CREW EXECUTION
 # ============================================================================
 
-crew = Crew(
-    agents=[job_scraper, profile_matcher, job_ranker, resume_strategist, interview_prepper],
-    tasks=[job_search_task, profile_matching_task, job_ranking_task, resume_tailoring_task, interview_prep_task],
+# Search & match -> rank runs in order; each step needs the previous one
+ranking_crew = Crew(
+    agents=[job_scraper, job_ranker],
+    tasks=[job_search_task, job_ranking_task],
     process=Process.sequential,
-    verbose=True
+    verbose=CREW_VERBOSE,
+    output_log_file=CREW_LOG_FILE
+)
+
+# Resume tailoring and interview prep only depend on the ranking,
+# so they run as two separate crews at the same time
+resume_crew = Crew(
+    agents=[resume_strategist],
+    tasks=[resume_tailoring_task],
+    verbose=CREW_VERBOSE,
+    output_log_file=CREW_LOG_FILE
 )
 
+interview_crew = Crew(
+    agents=[interview_prepper],
+    tasks=[interview_prep_task],
+    verbose=CREW_VERBOSE,
+    output_log_file=CREW_LOG_FILE
+)
+
+async def run_crews(inputs):
+    await asyncio.to_thread(prepare_prefilter, inputs['personal_writeup'])
+    ranking = await asyncio.to_thread(ranking_crew.kickoff, inputs=inputs)
+    # One crew failing must not throw away the other's finished output;
+    # a failed crew comes back as its exception
+    resumes, preps = await asyncio.gather(
+        asyncio.to_thread(resume_crew.kickoff, inputs=inputs),
+        asyncio.to_thread(interview_crew.kickoff, inputs=inputs),
+        return_exceptions=True
+    )
+    return ranking, resumes, preps
+
+# Progress messages are buffered and written to stdout in batches: errors flush
+# immediately, and the main block flushes at the end of each phase so progress
+# shows up while the run is going (e.g. before the ranking's human input prompt)
+logger = logging.getLogger("crew")
+logger.setLevel(logging.INFO)
+log_buffer = logging.handlers.MemoryHandler(1024, target=logging.StreamHandler(sys.stdout))
+logger.addHandler(log_buffer)
+
+# Characters stripped from LLM-chosen filenames before saving
+UNSAFE_FILENAME_CHARS = re.compile(r'[\\/*?:"<>|]')
+
 enhanced_inputs = {
     'search_query': 'Consultant AI Cloud Transformation Cybersecurity',
     'locations': ['Remote', 'Kuala Lumpur', 'Singapore'],
@@ -214,70 +494,127 @@ enhanced_inputs = {
 }
 
 if __name__ == "__main__":
-    print("Starting Crew...")
+    logger.info("Starting Crew...")
+    log_buffer.flush()
     
     try:
-        # 1. Run the crew
-        result = crew.kickoff(inputs=enhanced_inputs)
-        print("\nCrew finished processing.")
+        # 1. Run the crews
+        ranking_result, resume_result, prep_result = asyncio.run(run_crews(enhanced_inputs))
+        logger.info("\nCrew finished processing.")
+        log_buffer.flush()
         
         # 2. Custom File Generator Logic
-        #    This reads the JSON files created by the tasks and splits them into individual files
-        print("Saving individual files...")
+        #    This splits each task's JSON output into individual files, using the
+        #    in-memory crew result and only reading the task's JSON file as a fallback
+        logger.info("Saving individual files...")
         
         # Helper to clean and parse JSON (sometimes LLMs add text around the JSON)
-        def extract_json(text):
+        def extract_json(data):
+            # Try finding first { and last }
+            start = data.find(b'{')
+            end = data.rfind(b'}') + 1
+            if start != -1 and end > start:
+                data = data[start:end]
             try:
-                # Try finding first { and last }
-                start = text.find('{')
-                end = text.rfind('}') + 1
-                if start != -1 and end != -1:
-                    return json.loads(text[start:end])
-                return json.loads(text)
-            except:
-                print(f"Error parsing JSON content. Check the output files manually.")
-                return {}
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                try:
+                    # Raw newlines inside strings are common in LLM output; only the lenient parser accepts them
+                    return json.loads(data.decode('utf-8'), strict=False)
+                except ValueError:
+                    logger.error("Error parsing JSON content. Check the output files manually.")
+                    return {}
 
-        # Save Resumes
-        if os.path.exists("resumes_data.json"):
-            with open("resumes_data.json", "r", encoding='utf-8') as f:
-                content = f.read()
-                resumes = extract_json(content)
-                
-            # Create directory if not exists
-            os.makedirs("tailored_resumes", exist_ok=True)
-            
-            for filename, body in resumes.items():
-                # Clean filename just in case
-                safe_filename = re.sub(r'[\\/*?:"<>|]', "", filename)
-                if not safe_filename.endswith(".md"): safe_filename += ".md"
-                
-                filepath = os.path.join("tailored_resumes", safe_filename)
-                with open(filepath, "w", encoding='utf-8') as f:
-                    f.write(body)
-                print(f"Saved: {filepath}")
+        # Helper to pull the filename -> content mapping out of a finished crew
+        def crew_items(crew_output):
+            if crew_output is None:
+                return None
+            if crew_output.pydantic is not None:
+                return crew_output.pydantic.model_dump()
+            if crew_output.json_dict:
+                return crew_output.json_dict
+            if crew_output.raw:
+                return extract_json(crew_output.raw.encode('utf-8')) or None
+            return None
 
-        # Save Interview Prep
-        if os.path.exists("interview_prep_data.json"):
-            with open("interview_prep_data.json", "r", encoding='utf-8') as f:
-                content = f.read()
-                preps = extract_json(content)
+        # Helper to name resume_N files after the Nth ranked job, like the prep files
+        def resume_names(ranking_output):
+            raw = (ranking_output.raw if ranking_output is not None else "").encode('utf-8')
+            start = raw.find(b'[')
+            end = raw.rfind(b']') + 1
+            try:
+                jobs = orjson.loads(raw[start:end]) if start != -1 and end > start else []
+            except orjson.JSONDecodeError:
+                jobs = []
+            names = {}
+            for number, job in enumerate(jobs, 1):
+                if isinstance(job, dict):
+                    label = "_".join(str(job.get(field, "")) for field in ("company", "title"))
+                    names[f"resume_{number}"] = re.sub(r"\s+", "_", f"resume_{number}_{label}")
+            return names
+
+        # Helper to write one markdown file from a filename -> content pair
+        def save_markdown(out_dir, filename, body):
+            # Clean filename just in case
+            safe_filename = UNSAFE_FILENAME_CHARS.sub("", filename)
+            if not safe_filename.endswith(".md"): safe_filename += ".md"
+            
+            filepath = os.path.join(out_dir, safe_filename)
+            Path(filepath).write_bytes(body.encode('utf-8'))
+            logger.info("Saved: %s", filepath)
+        
+        # Helper to split a task's JSON output into individual files
+        def save_markdown_files(json_path, out_dir, items=None, names=None):
+            if items is None and not os.path.exists(json_path):
+                return
+            rename = (names or {}).get
             
-            os.makedirs("interview_prep", exist_ok=True)
+            # Create directory if not exists
+            os.makedirs(out_dir, exist_ok=True)
             
-            for filename, body in preps.items():
-                safe_filename = re.sub(r'[\\/*?:"<>|]', "", filename)
-                if not safe_filename.endswith(".md"): safe_filename += ".md"
+            # Files are written on a thread pool so the writes overlap
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = []
+                if items is not None:
+                    futures = [pool.submit(save_markdown, out_dir, rename(filename, filename), body)
+                               for filename, body in items.items()]
+                else:
+                    try:
+                        # Stream the top-level pairs straight to disk
+                        with open(json_path, "rb") as f:
+                            for filename, body in ijson.kvitems(f, ''):
+                                futures.append(pool.submit(save_markdown, out_dir, rename(filename, filename), body))
+                    except ijson.JSONError:
+                        # Not clean JSON (e.g. text around it) - parse the whole file instead.
+                        # Let any files already streamed finish before they are rewritten.
+                        for future in futures:
+                            future.result()
+                        with open(json_path, "rb") as f:
+                            items = extract_json(f.read())
+                        futures = [pool.submit(save_markdown, out_dir, rename(filename, filename), body)
+                                   for filename, body in items.items()]
                 
-                filepath = os.path.join("interview_prep", safe_filename)
-                with open(filepath, "w", encoding='utf-8') as f:
-                    f.write(body)
-                print(f"Saved: {filepath}")
+                for future in futures:
+                    future.result()
+        
+        # Save Resumes
+        if isinstance(resume_result, Exception):
+            logger.error("Resume crew failed, no resumes saved: %r", resume_result)
+        else:
+            save_markdown_files("resumes_data.json", "tailored_resumes", crew_items(resume_result),
+                                resume_names(ranking_result))
+        log_buffer.flush()
+        
+        # Save Interview Prep
+        if isinstance(prep_result, Exception):
+            logger.error("Interview prep crew failed, no prep files saved: %r", prep_result)
+        else:
+            save_markdown_files("interview_prep_data.json", "interview_prep", crew_items(prep_result))
+        log_buffer.flush()
                 
-        print("\nAll Done!")
-        print("Check 'tailored_resumes' and 'interview_prep' folders.")
+        logger.info("\nAll Done!")
+        logger.info("Check 'tailored_resumes' and 'interview_prep' folders.")
+        log_buffer.flush()
 
     except Exception as e:
-        print(f"\nAn error occurred: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+        logger.exception(f"\nAn error occurred: {e}")
\ No newline at end of file
@@ -1,24 +1,111 @@
+import asyncio
 import feedparser
-import requests
+import httpx
 import json
+import os
+import re
 import time
+from contextlib import asynccontextmanager
 
 # === CONFIG ===
 RSS_FEED_URL = "https://www.theverge.com/rss/index.xml"  # Replace with your favorite
+RSS_FEED_URLS = [RSS_FEED_URL]  # Add more feeds to fetch them concurrently
 LLM_API_URL = "http://localhost:1234/v1/chat/completions"  # LM Studio endpoint
 ELEVENLABS_API_KEY = "your_elevenlabs_api_key_here"
 VOICE_ID = "your_voice_id_here"  # Get from ElevenLabs dashboard
 OUTPUT_FILE = "techcast.mp3"
+TTS_OUTPUT_FORMAT = "mp3_22050_32"  # Half the bytes of the default; use "mp3_44100_128" for full quality
+TTS_CHUNK_SIZE = 65536
+TTS_SEGMENT_CHARS = 300  # Sentences are grouped up to this size before each TTS request
+RSS_CACHE_FILE = ".rss_cache.json"  # ETag / Last-Modified and titles from the last fetch
+MAX_CONCURRENT_REQUESTS = 10  # Keeps LM Studio / ElevenLabs under their rate limits
+POOL_MAXSIZE = 8  # Pooled keep-alive connections shared by all hosts
+HTTP_TIMEOUT = 60  # Seconds; TTS of a full script can take a while
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3  # Seconds; doubles on every retry
+RETRY_STATUSES = {429, 500, 502, 503}
+
+# Shared by every outbound call
+request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+@asynccontextmanager
+async def post_with_retry(client, url, **kwargs):
+    # Retries transient failures (retryable statuses, dropped connections,
+    # timeouts) with exponential backoff instead of crashing the run.
+    # Only opening the response is retried; the body is streamed by the caller
+    request = client.build_request("POST", url, **kwargs)
+    for attempt in range(RETRY_TOTAL + 1):
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.TransportError:
+            if attempt == RETRY_TOTAL:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                break
+            await response.aclose()
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    try:
+        yield response
+    finally:
+        await response.aclose()
 
 
 # === STEP 1: Get Headlines ===
-def fetch_headlines(limit=5):
-    feed = feedparser.parse(RSS_FEED_URL)
-    return [entry.title for entry in feed.entries[:limit]]
+def load_rss_cache():
+    try:
+        with open(RSS_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_rss_cache(cache):
+    with open(RSS_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+async def fetch_headlines(client, url=RSS_FEED_URL, limit=5, cache=None):
+    # Conditional GET: an unchanged feed answers 304 and we reuse the cached titles
+    cache = {} if cache is None else cache
+    cached = cache.get(url, {})
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+
+    async with request_slots:
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            # Network trouble (DNS, refused, timeout) shouldn't sink the whole run
+            print(f"⚠️ Feed {url} failed ({e!r}), using cached headlines")
+            return cached.get("titles", [])[:limit]
+    if response.status_code == 304:
+        return cached["titles"][:limit]
+    if not response.is_success:
+        # Keep the last good headlines rather than caching an error page
+        print(f"⚠️ Feed {url} returned {response.status_code}, using cached headlines")
+        return cached.get("titles", [])[:limit]
+    etag = response.headers.get("ETag")
+    modified = response.headers.get("Last-Modified")
+
+    feed = feedparser.parse(response.content)
+    titles = [entry.title for entry in feed.entries]
+    cache[url] = {"etag": etag, "modified": modified, "titles": titles}
+    return titles[:limit]
 
 
 # === STEP 2: Summarize with LLM ===
-def generate_script(headlines):
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+async def stream_script(client, headlines):
+    # Streams the completion and yields the script a few sentences at a time,
+    # so speech synthesis can start before the LLM has finished
     prompt = f"""
 You are a tech news podcaster. Turn these headlines into a natural 2–3 minute podcast script.
 Make it friendly, engaging, and sound spoken aloud. Add intro + signoff.
@@ -30,16 +117,41 @@ Headlines:
         "model": "mistral",  # or whatever you named your model
         "messages": [{"role": "user", "content": prompt}],
         "temperature": 0.7,
+        "stream": True,
     }
 
-    response = requests.post(LLM_API_URL, json=data)
-    result = response.json()
-    return result['choices'][0]['message']['content']
+    buffer = ""
+    async with request_slots:
+        async with post_with_retry(client, LLM_API_URL, json=data) as response:
+            if response.status_code != 200:
+                # An error body has no SSE events; fail instead of yielding nothing
+                await response.aread()
+                raise RuntimeError(f"LLM request failed: {response.status_code}, {response.text}")
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = line[5:].strip()
+                if event == "[DONE]":
+                    break
+                buffer += json.loads(event)['choices'][0]['delta'].get('content') or ""
+
+                # Everything before the last sentence break is complete
+                *sentences, buffer = SENTENCE_END.split(buffer)
+                if sentences:
+                    segment = " ".join(sentences)
+                    if len(segment) + len(buffer) >= TTS_SEGMENT_CHARS:
+                        yield segment
+                    else:
+                        buffer = segment + " " + buffer
+    if buffer.strip():
+        yield buffer
 
 
 # === STEP 3: Generate TTS with ElevenLabs ===
-def text_to_speech(text, output_path):
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}"
+async def text_to_speech(client, text, out):
+    # The streaming endpoint sends audio as it is generated; MP3 frames from
+    # consecutive segments can be appended to one file
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}/stream"
 
     headers = {
         "xi-api-key": ELEVENLABS_API_KEY,
@@ -52,23 +164,73 @@ def text_to_speech(text, output_path):
         "voice_settings": {"stability": 0.75, "similarity_boost": 0.75}
     }
 
-    response = requests.post(url, headers=headers, json=payload)
-
-    if response.status_code == 200:
-        with open(output_path, "wb") as f:
-            f.write(response.content)
-        print(f"✅ Podcast saved as: {output_path}")
-    else:
-        print(f"❌ Error: {response.status_code}, {response.text}")
+    async with request_slots:
+        async with post_with_retry(client, url, headers=headers, json=payload,
+                                   params={"output_format": TTS_OUTPUT_FORMAT}) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"❌ Error: {response.status_code}, {response.text}")
+                return False
+
+            # Write audio as it arrives instead of holding the whole MP3 in memory
+            async for chunk in response.aiter_bytes(TTS_CHUNK_SIZE):
+                out.write(chunk)
+    return True
+
+
+async def script_to_speech(client, headlines, output_path):
+    # The LLM keeps streaming into the queue while earlier segments are spoken
+    segments = asyncio.Queue()
+
+    async def produce():
+        try:
+            async for segment in stream_script(client, headlines):
+                await segments.put(segment)
+        finally:
+            await segments.put(None)
+
+    # Audio goes to a temp file that only replaces an existing podcast once
+    # every segment has been spoken; a failed LLM call is re-raised by
+    # awaiting the producer
+    partial_path = output_path + ".part"
+    producer = asyncio.create_task(produce())
+    try:
+        segment = await segments.get()
+        if segment is None:
+            await producer
+            print("❌ Error: the LLM returned an empty script")
+            return
+        with open(partial_path, "wb") as out:
+            while segment is not None:
+                if not await text_to_speech(client, segment, out):
+                    return
+                segment = await segments.get()
+        await producer
+        os.replace(partial_path, output_path)
+    finally:
+        producer.cancel()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    print(f"✅ Podcast saved as: {output_path}")
 
 
 # === MAIN ===
-if __name__ == "__main__":
-    print("🔍 Fetching headlines...")
-    headlines = fetch_headlines()
+async def main():
+    # One client for all calls so TCP/TLS connections are reused; HTTP/2 lets
+    # ElevenLabs requests share a single multiplexed connection. Redirects are
+    # followed so moved feeds keep working, as with feedparser's own fetch
+    limits = httpx.Limits(max_connections=POOL_MAXSIZE)
+    async with httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=limits,
+                                 follow_redirects=True) as client:
+        print("🔍 Fetching headlines...")
+        rss_cache = load_rss_cache()
+        feeds = await asyncio.gather(*[fetch_headlines(client, url, cache=rss_cache) for url in RSS_FEED_URLS])
+        save_rss_cache(rss_cache)
+        headlines = [title for titles in feeds for title in titles]
+
+        print("🧠 Generating podcast script and converting to speech...")
+        await script_to_speech(client, headlines, OUTPUT_FILE)
 
-    print("🧠 Generating podcast script...")
-    script = generate_script(headlines)
 
-    print("🎙️ Converting to speech...")
-    text_to_speech(script, OUTPUT_FILE)
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file